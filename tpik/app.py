@@ -6,12 +6,15 @@ A beautiful, responsive terminal interface for managing tmux sessions.
 Completely rewritten for reliability and modern aesthetics.
 """
 
+import asyncio
+import bisect
+import functools
 import os
-import subprocess
+import re
 import sys
+import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, Center
@@ -19,10 +22,10 @@ from textual.widgets import (
     Header, Footer, DataTable, Static, Button, Input, Label,
     Pretty, ProgressBar, Select, Switch, ListItem, ListView
 )
-from textual.reactive import reactive
+from textual.binding import Binding
 from textual.message import Message
 from textual.screen import Screen
-from textual import events, work
+from textual import work
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
@@ -30,10 +33,80 @@ from rich.table import Table
 from rich.align import Align
 
 
+# One precompiled scan over each formatted list-sessions line:
+# name|created|windows|attached|window_preview
+_SESSION_LINE_RE = re.compile(r"([^|]+)\|(\d+)\|(\d+)\|([01])(?:\|(.*))?$")
+
+# Format string matching _SESSION_LINE_RE above
+_SESSION_FORMAT = "#{session_name}|#{session_created}|#{session_windows}|#{session_attached}|#{window_name}"
+
+# Hidden session the control client parks on (never shown in the list;
+# destroy-unattached makes tmux clean it up when the app exits)
+_CTL_SESSION = "__tpik_ctl"
+
+# Session names that can be passed to the control client without quoting
+_CTL_SAFE_NAME = re.compile(r"^[\w@-]+$")
+
+# Argv templates hoisted to module scope so the hot call sites don't rebuild
+# the same list literals on every invocation
+_TMUX_VERSION_ARGV = ("tmux", "-V")
+_DISPLAY_CURRENT_ARGV = ("tmux", "display-message", "-p", "#{session_name}")
+_LIST_SESSIONS_ARGV = ("tmux", "list-sessions", "-F", _SESSION_FORMAT)
+_CURRENT_CHAIN = (";", "display-message", "-p", "@current|#{session_name}")
+_SWITCH_CLIENT_PREFIX = ("tmux", "switch-client", "-t")
+_NEW_SESSION_PREFIX = ("tmux", "new-session", "-d", "-s")
+_KILL_SESSION_PREFIX = ("tmux", "kill-session", "-t")
+_CTL_ARGV = ("tmux", "-C", "new-session", "-A", "-s", _CTL_SESSION,
+             ";", "set-option", "destroy-unattached", "on")
+
+# Static header banner - built once at import instead of re-parsing the
+# markup every time compose runs
+_HEADER = Align.center(
+    "[bold white]╭─────────────────────────────────────────────────────────────╮\n"
+    "│            🚀 TPIK - Enhanced TMUX Manager 🚀            │\n"
+    "│                   Modern Terminal Interface                  │\n"
+    "╰─────────────────────────────────────────────────────────────╯[/]"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_session_text(favorite: bool, attached: bool, name: str,
+                         windows: int, created: str, preview: str,
+                         is_current: bool) -> Text:
+    """Build the rich display text for a session row.
+
+    Memoized on the full state tuple: a row whose state hasn't changed is
+    served from the cache instead of re-running the append chain, and the
+    returned Text is treated as read-only by all callers.
+    """
+    status_color = "green" if attached else "cyan"
+    name_style = "bold green" if attached else "white"
+
+    display_text = Text()
+    display_text.append("★ " if favorite else "☆ ", style="yellow")
+    display_text.append("● " if attached else "○ ", style=status_color)
+    display_text.append(name, style=name_style)
+    display_text.append(f" ({windows}w)", style="cyan")
+    display_text.append(f" - {created}", style="dim")
+
+    if preview:
+        display_text.append(f" [{preview}]", style="dim")
+
+    if is_current:
+        display_text.append(" [CURRENT]", style="bold magenta")
+
+    return display_text
+
+
 class TmuxSession:
     """Represents a tmux session with all its metadata."""
-    
-    def __init__(self, name: str, created: str, windows: int, 
+
+    # One instance per session per refresh - __slots__ drops the per-instance
+    # __dict__ and speeds up the attribute reads in the filter/render paths
+    __slots__ = ("name", "created", "windows", "attached",
+                 "window_preview", "is_favorite", "_name_lower")
+
+    def __init__(self, name: str, created: str, windows: int,
                  attached: bool = False, window_preview: str = ""):
         self.name = name
         self.created = created
@@ -41,6 +114,8 @@ class TmuxSession:
         self.attached = attached
         self.window_preview = window_preview
         self.is_favorite = False
+        # Cached lowercase name so search filtering avoids per-keystroke .lower()
+        self._name_lower = name.lower()
         
     def __str__(self) -> str:
         return self.name
@@ -67,169 +142,401 @@ class TmuxManager:
         self.templates_file = self.config_dir / "templates"
         self.history_file = self.config_dir / "history"
         
-        # Ensure config directory exists
+        # Ensure config directory exists - the files themselves are created
+        # lazily on first write, and the readers treat a missing file as
+        # empty, so startup skips three exists/write round-trips
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create empty files if they don't exist
-        for file_path in [self.favorites_file, self.templates_file, self.history_file]:
-            if not file_path.exists():
-                file_path.write_text("")
-        
-    def is_tmux_available(self) -> bool:
-        """Check if tmux is installed and available."""
-        try:
-            result = subprocess.run(["tmux", "-V"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-            
+
+        # Cached tmux state - avoids re-probing with extra subprocesses.
+        # TMUX env presence can't change during the app's lifetime, so it is
+        # read exactly once here.
+        self._inside_tmux: bool = "TMUX" in os.environ
+        self._tmux_ok: Optional[bool] = None
+        self._current_session: Optional[str] = None
+
+        # Favorites cache - only re-read from disk when the file changes
+        self._fav_cache: Optional[set] = None
+        self._fav_mtime: float = 0.0
+        # Snapshot of what is on disk, so no-op saves can be skipped
+        self._fav_saved: Optional[frozenset] = None
+        # Warm the cache now so the first refresh is a pure memory read
+        self.load_favorites()
+
+        # Long-lived control-mode client (tmux -C) - one persistent process
+        # instead of a fork per command
+        self._ctl: Optional[asyncio.subprocess.Process] = None
+        self._ctl_lock: Optional[asyncio.Lock] = None
+
+        # Fingerprint of the last list-sessions output - lets refreshes skip
+        # all parsing/UI work when nothing changed
+        self._last_fingerprint: str = ""
+
+        # Short TTL cache so bursts of get_sessions calls within a second
+        # share one tmux round-trip
+        self._sessions_cache: Optional[List[TmuxSession]] = None
+        self._sessions_ts: float = 0.0
+
+    async def is_tmux_available(self) -> bool:
+        """Check if tmux is installed and available (probed once, then cached)."""
+        if self._tmux_ok is None:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *_TMUX_VERSION_ARGV,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                self._tmux_ok = await proc.wait() == 0
+            except (OSError, FileNotFoundError):
+                self._tmux_ok = False
+        return self._tmux_ok
+
     def is_inside_tmux(self) -> bool:
         """Check if we're currently inside a tmux session."""
-        return "TMUX" in os.environ
-        
-    def get_current_session(self) -> Optional[str]:
+        return self._inside_tmux
+
+    async def _ensure_ctl(self) -> Optional[asyncio.subprocess.Process]:
+        """Start (or reuse) the long-lived tmux control-mode client."""
+        if self._ctl is not None and self._ctl.returncode is None:
+            return self._ctl
+
+        if self._ctl_lock is None:
+            self._ctl_lock = asyncio.Lock()
+
+        # Spawn under the same lock that serializes command I/O, so two
+        # callers racing past the check above can't each start a client
+        # (the loser would stay attached with open pipes for the app's life)
+        async with self._ctl_lock:
+            if self._ctl is not None and self._ctl.returncode is None:
+                return self._ctl
+
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *_CTL_ARGV,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            except OSError:
+                return None
+
+            # Drain the reply blocks tmux emits for the startup commands (one
+            # per chained command) so they aren't mistaken for later replies
+            try:
+                pending_replies = 2  # new-session and set-option
+                while pending_replies:
+                    raw = await asyncio.wait_for(proc.stdout.readline(), 1.0)
+                    if not raw:
+                        break
+                    if raw.startswith((b"%end", b"%error")):
+                        pending_replies -= 1
+            except asyncio.TimeoutError:
+                pass
+
+            if proc.returncode is not None:
+                # No server running (or attach refused) - fall back to one-shots
+                return None
+
+            self._ctl = proc
+            return proc
+
+    async def _ctl_cmd(self, command: str) -> Optional[Tuple[bool, List[str]]]:
+        """Run one command on the control-mode client.
+
+        Returns (success, output_lines), or None when the control client is
+        unavailable and the caller should fall back to a one-shot subprocess.
+        """
+        proc = await self._ensure_ctl()
+        if proc is None:
+            return None
+
+        async with self._ctl_lock:
+            try:
+                proc.stdin.write(command.encode() + b"\n")
+                await proc.stdin.drain()
+
+                lines: List[str] = []
+                in_block = False
+                while True:
+                    raw = await proc.stdout.readline()
+                    if not raw:
+                        raise ConnectionError("control client closed")
+                    line = raw.decode().rstrip("\n")
+                    if line.startswith("%begin"):
+                        in_block = True
+                        lines = []
+                    elif line.startswith("%end"):
+                        if in_block:
+                            return True, lines
+                    elif line.startswith("%error"):
+                        if in_block:
+                            return False, lines
+                    elif in_block:
+                        lines.append(line)
+                    # Notifications outside a reply block are ignored
+            except (OSError, ConnectionError):
+                self._ctl = None
+                return None
+
+    async def get_current_session(self) -> Optional[str]:
         """Get the name of the current tmux session if inside one."""
         if not self.is_inside_tmux():
             return None
-        try:
-            result = subprocess.run(
-                ["tmux", "display-message", "-p", "#{session_name}"],
-                capture_output=True, text=True, check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
+        if self._current_session is None:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *_DISPLAY_CURRENT_ARGV,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                stdout, _ = await proc.communicate()
+                if proc.returncode == 0:
+                    self._current_session = stdout.decode().strip()
+            except OSError:
+                return None
+        return self._current_session
+
+    def _parse_session_line(self, line: str, favorites: set) -> Optional[TmuxSession]:
+        """Parse one formatted list-sessions line into a TmuxSession."""
+        match = _SESSION_LINE_RE.match(line)
+        if match is None:
             return None
-            
-    def get_sessions(self) -> List[TmuxSession]:
-        """Get all available tmux sessions."""
+
+        name = match.group(1)
+        if name == _CTL_SESSION:
+            return None
+
+        # Convert timestamp to readable format - the regex guarantees digits,
+        # so only out-of-range values can fail here. localtime + f-string is
+        # roughly an order of magnitude cheaper than datetime + strftime
         try:
-            # Get session list with detailed info
-            result = subprocess.run(
-                ["tmux", "list-sessions", "-F", 
-                 "#{session_name}|#{session_created}|#{session_windows}|#{session_attached}|#{window_name}"],
-                capture_output=True, text=True, check=True
-            )
-            
+            tm = time.localtime(int(match.group(2)))
+            created = f"{tm.tm_mon:02d}/{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}"
+        except (ValueError, OverflowError, OSError):
+            created = "Unknown"
+
+        session = TmuxSession(
+            name=name,
+            created=created,
+            windows=int(match.group(3)),
+            attached=match.group(4) == "1",
+            window_preview=match.group(5) or ""
+        )
+        session.is_favorite = name in favorites
+        return session
+
+    async def get_sessions(self) -> Optional[List[TmuxSession]]:
+        """Get all available tmux sessions without blocking the event loop.
+
+        Returns None when the session list is identical to the previous
+        call, so callers can skip re-rendering entirely.
+        """
+        if (self._sessions_cache is not None
+                and time.monotonic() - self._sessions_ts < 1.0):
+            return self._sessions_cache
+
+        favorites = self.load_favorites()
+
+        # Preferred path: ask the persistent control-mode client, avoiding a
+        # subprocess spawn per refresh
+        # The format must be quoted: an unquoted # starts a comment in tmux's
+        # command parser
+        reply = await self._ctl_cmd(f"list-sessions -F '{_SESSION_FORMAT}'")
+        if reply is not None:
+            ok, lines = reply
+            if not ok:
+                self._last_fingerprint = ""
+                return []
+            fingerprint = "\n".join(lines)
+            if fingerprint == self._last_fingerprint:
+                self._sessions_ts = time.monotonic()
+                return None
+            self._last_fingerprint = fingerprint
             sessions = []
-            favorites = self.load_favorites()
-            
-            for line in result.stdout.strip().split("\n"):
-                if not line.strip():
-                    continue
-                    
-                parts = line.split("|")
-                if len(parts) >= 4:
-                    name, created_timestamp, windows, attached = parts[:4]
-                    window_preview = parts[4] if len(parts) > 4 else ""
-                    
-                    # Convert timestamp to readable format
-                    try:
-                        created_dt = datetime.fromtimestamp(int(created_timestamp))
-                        created = created_dt.strftime("%m/%d %H:%M")
-                    except (ValueError, TypeError):
-                        created = "Unknown"
-                        
-                    session = TmuxSession(
-                        name=name,
-                        created=created, 
-                        windows=int(windows) if windows.isdigit() else 0,
-                        attached=attached == "1",
-                        window_preview=window_preview
-                    )
-                    session.is_favorite = name in favorites
+            for line in lines:
+                session = self._parse_session_line(line, favorites)
+                if session is not None:
                     sessions.append(session)
-                    
+            self._sessions_cache = sessions
+            self._sessions_ts = time.monotonic()
             return sessions
-            
-        except subprocess.CalledProcessError:
+
+        # Fallback: one-shot subprocess - when inside tmux, chain a
+        # display-message so it also yields the current session
+        cmd = _LIST_SESSIONS_ARGV
+        if self.is_inside_tmux():
+            cmd += _CURRENT_CHAIN
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except (OSError, FileNotFoundError):
+            return []
+
+        sessions = []
+        raw_lines = []
+
+        # Stream the output line by line instead of buffering the whole
+        # stdout and re-scanning it
+        async for raw_line in proc.stdout:
+            line = raw_line.decode().rstrip("\n")
+            if not line:
+                continue
+
+            if line.startswith("@current|"):
+                self._current_session = line.split("|", 1)[1]
+                continue
+
+            raw_lines.append(line)
+            session = self._parse_session_line(line, favorites)
+            if session is not None:
+                sessions.append(session)
+
+        if await proc.wait() != 0:
+            self._last_fingerprint = ""
             return []
+
+        fingerprint = "\n".join(raw_lines)
+        if fingerprint == self._last_fingerprint:
+            self._sessions_ts = time.monotonic()
+            return None
+        self._last_fingerprint = fingerprint
+        self._sessions_cache = sessions
+        self._sessions_ts = time.monotonic()
+        return sessions
             
-    def attach_session(self, session_name: str) -> tuple[bool, str]:
+    async def attach_session(self, session_name: str) -> tuple[bool, str]:
         """Attach to a tmux session. Returns (success, message)."""
         try:
             if self.is_inside_tmux():
                 # Switch to session if inside tmux
-                result = subprocess.run(
-                    ["tmux", "switch-client", "-t", session_name], 
-                    capture_output=True, text=True, check=False
+                proc = await asyncio.create_subprocess_exec(
+                    *_SWITCH_CLIENT_PREFIX, session_name,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE
                 )
-                if result.returncode == 0:
+                _, stderr = await proc.communicate()
+                if proc.returncode == 0:
                     return True, f"Switched to session '{session_name}'"
                 else:
-                    return False, f"Failed to switch: {result.stderr.strip()}"
+                    return False, f"Failed to switch: {stderr.decode().strip()}"
             else:
-                # For attaching from outside tmux, we need to handle this differently
-                # We'll use a different approach to avoid jumping issues
-                result = subprocess.run(
-                    ["tmux", "has-session", "-t", session_name],
-                    capture_output=True, check=False
-                )
-                if result.returncode == 0:
-                    # Session exists, now we need to prepare for attachment
-                    # The app will exit and let the wrapper script handle attachment
-                    return True, f"Preparing to attach to '{session_name}'"
-                else:
-                    return False, f"Session '{session_name}' does not exist"
+                # For attaching from outside tmux the app exits and lets the
+                # wrapper script handle attachment. The session came from the
+                # list we just fetched, so skip the has-session probe - the
+                # wrapper reports a vanished session on its own.
+                return True, f"Preparing to attach to '{session_name}'"
         except Exception as e:
             return False, f"Error: {str(e)}"
             
-    def create_session(self, session_name: str, start_directory: Optional[str] = None) -> tuple[bool, str]:
+    async def create_session(self, session_name: str, start_directory: Optional[str] = None) -> tuple[bool, str]:
         """Create a new tmux session. Returns (success, message)."""
         try:
-            # Check if session already exists
-            result = subprocess.run(
-                ["tmux", "has-session", "-t", session_name],
-                capture_output=True, check=False
-            )
-            if result.returncode == 0:
-                return False, f"Session '{session_name}' already exists"
-            
-            cmd = ["tmux", "new-session", "-d", "-s", session_name]
+            # Attempt the creation directly and interpret the error instead
+            # of paying for a separate has-session precheck.
+
+            # Preferred path: the persistent control-mode client
+            if start_directory is None and _CTL_SAFE_NAME.match(session_name):
+                reply = await self._ctl_cmd(f"new-session -d -s {session_name}")
+                if reply is not None:
+                    ok, lines = reply
+                    if ok:
+                        self._sessions_ts = 0.0
+                        return True, f"Created session '{session_name}'"
+                    error = lines[0] if lines else "unknown error"
+                    if "duplicate session" in error:
+                        return False, f"Session '{session_name}' already exists"
+                    return False, f"Failed to create session: {error}"
+
+            cmd = [*_NEW_SESSION_PREFIX, session_name]
             if start_directory and os.path.exists(start_directory):
                 cmd.extend(["-c", start_directory])
-                
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result.returncode == 0:
+
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode == 0:
+                self._sessions_ts = 0.0
                 return True, f"Created session '{session_name}'"
-            else:
-                return False, f"Failed to create session: {result.stderr.strip()}"
+            error = stderr.decode().strip()
+            if "duplicate session" in error:
+                return False, f"Session '{session_name}' already exists"
+            return False, f"Failed to create session: {error}"
         except Exception as e:
             return False, f"Error: {str(e)}"
-            
-    def kill_session(self, session_name: str) -> tuple[bool, str]:
+
+    async def kill_session(self, session_name: str) -> tuple[bool, str]:
         """Kill a tmux session. Returns (success, message)."""
         try:
-            result = subprocess.run(
-                ["tmux", "kill-session", "-t", session_name], 
-                capture_output=True, text=True, check=False
+            # Preferred path: the persistent control-mode client
+            if _CTL_SAFE_NAME.match(session_name):
+                reply = await self._ctl_cmd(f"kill-session -t ={session_name}")
+                if reply is not None:
+                    ok, lines = reply
+                    if ok:
+                        self._sessions_ts = 0.0
+                        return True, f"Killed session '{session_name}'"
+                    error = lines[0] if lines else "unknown error"
+                    return False, f"Failed to kill session: {error}"
+
+            proc = await asyncio.create_subprocess_exec(
+                *_KILL_SESSION_PREFIX, session_name,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
             )
-            if result.returncode == 0:
+            _, stderr = await proc.communicate()
+            if proc.returncode == 0:
+                self._sessions_ts = 0.0
                 return True, f"Killed session '{session_name}'"
             else:
-                return False, f"Failed to kill session: {result.stderr.strip()}"
+                return False, f"Failed to kill session: {stderr.decode().strip()}"
         except Exception as e:
             return False, f"Error: {str(e)}"
             
     def load_favorites(self) -> set:
-        """Load favorite sessions from config file."""
+        """Load favorite sessions, re-reading the file only when it changes."""
+        try:
+            mtime = self.favorites_file.stat().st_mtime
+        except OSError:
+            return set()
+
+        if self._fav_cache is not None and mtime == self._fav_mtime:
+            return self._fav_cache
+
         try:
-            if not self.favorites_file.exists():
-                return set()
-            content = self.favorites_file.read_text().strip()
-            if not content:
-                return set()
-            return set(line.strip() for line in content.split("\n") if line.strip())
+            content = self.favorites_file.read_text()
+            self._fav_cache = set(
+                line.strip() for line in content.splitlines() if line.strip()
+            )
+            self._fav_mtime = mtime
+            self._fav_saved = frozenset(self._fav_cache)
+            return self._fav_cache
         except Exception:
             return set()
-            
+
     def save_favorites(self, favorites: set) -> None:
-        """Save favorite sessions to config file."""
+        """Save favorite sessions to config file atomically."""
         try:
+            # Nothing changed (e.g. a toggle that was immediately reverted) -
+            # skip the disk round-trip
+            if self._fav_saved is not None and favorites == self._fav_saved:
+                return
+
+            # Write-then-rename so a crash mid-write can't truncate the file
             content = "\n".join(sorted(favorites))
-            self.favorites_file.write_text(content + "\n" if content else "")
+            tmp = self.favorites_file.with_suffix(".tmp")
+            tmp.write_text(content + "\n" if content else "")
+            os.replace(tmp, self.favorites_file)
+
+            self._fav_cache = favorites
+            self._fav_saved = frozenset(favorites)
+            self._fav_mtime = self.favorites_file.stat().st_mtime
         except Exception:
             pass
-            
+
     def toggle_favorite(self, session_name: str) -> bool:
         """Toggle favorite status of a session."""
         favorites = self.load_favorites()
@@ -240,6 +547,10 @@ class TmuxManager:
             favorites.add(session_name)
             is_favorite = True
         self.save_favorites(favorites)
+        # Favorites are stamped onto sessions at parse time, so a
+        # fingerprint-based skip or TTL hit would keep stale icons
+        self._last_fingerprint = ""
+        self._sessions_ts = 0.0
         return is_favorite
 
 
@@ -415,33 +726,56 @@ class TpikApp(App):
     
     TITLE = "tpik - Enhanced TMUX Session Manager"
     SUB_TITLE = "Modern Terminal Interface v3.0"
-    
-    # Reactive attributes
-    sessions: reactive[List[TmuxSession]] = reactive([])
-    filtered_sessions: reactive[List[TmuxSession]] = reactive([])
-    search_query: reactive[str] = reactive("")
-    show_favorites_only: reactive[bool] = reactive(False)
-    current_session: reactive[Optional[str]] = reactive(None)
-    selected_session_name: reactive[Optional[str]] = reactive(None)
+
+    # Default number of session rows materialized per render window - plenty
+    # for any terminal height while keeping huge session counts cheap
+    RENDER_WINDOW = 50
+
+    # Keyboard shortcuts resolved by Textual's binding machinery instead of
+    # a per-event on_key handler (and no longer firing while typing in the
+    # search box)
+    BINDINGS = [
+        Binding("enter", "attach", "Attach", show=False),
+        Binding("n", "new_session", "New", show=False),
+        Binding("delete", "kill_session", "Kill", show=False),
+        Binding("f", "toggle_favorites_filter", "Filter Favs", show=False),
+        Binding("f5", "refresh", "Refresh", show=False),
+        Binding("q", "quit", "Quit", show=False),
+        Binding("space", "toggle_favorite", "Favorite", show=False),
+    ]
     
     def __init__(self):
         super().__init__()
         self.tmux = TmuxManager()
         self.session_list: Optional[ListView] = None
+        # Plain attributes - nothing watches them, so routing every
+        # assignment through Textual's reactive machinery was pure overhead;
+        # the update methods below are called explicitly instead
+        self.sessions: List[TmuxSession] = []
+        self.filtered_sessions: List[TmuxSession] = []
+        self.search_query: str = ""
+        # Lowered once when the query changes, not on every filter pass
+        self._search_query_lower: Optional[str] = None
+        self.show_favorites_only: bool = False
+        self.current_session: Optional[str] = None
+        self.selected_session_name: Optional[str] = None
+        # Rendered-row bookkeeping for incremental list updates
+        self._rendered_keys: List[str] = []
+        self._rendered_markup: Dict[str, str] = {}
+        # Row virtualization - only a viewport-sized window of the filtered
+        # list is materialized as widgets; extended on demand while scrolling
+        self._render_limit: int = self.RENDER_WINDOW
+        # Debounce state for search-as-you-type filtering
+        self._search_timer = None
+        self._pending_search: str = ""
+        # Monotonic token so a superseded refresh can't publish stale results
+        self._refresh_token: int = 0
         
     def compose(self) -> ComposeResult:
         """Compose the modern UI."""
         
         # Modern header with gradient
-        yield Static(
-            Align.center(
-                "[bold white]╭─────────────────────────────────────────────────────────────╮\n"
-                "│            🚀 TPIK - Enhanced TMUX Manager 🚀            │\n"
-                "│                   Modern Terminal Interface                  │\n"
-                "╰─────────────────────────────────────────────────────────────╯[/]"
-            ),
-            classes="app-header"
-        )
+        yield Static(_HEADER, classes="app-header")
         
         # Main container
         with Container(classes="main-container"):
@@ -480,85 +814,160 @@ class TpikApp(App):
         
     async def on_mount(self) -> None:
         """Initialize the app when mounted."""
-        # Check tmux availability
-        if not self.tmux.is_tmux_available():
+        # Launch the availability probe, current-session lookup and session
+        # list concurrently - they are independent, so startup pays max() of
+        # their latencies rather than the sum
+        available, self.current_session, sessions = await asyncio.gather(
+            self.tmux.is_tmux_available(),
+            self.tmux.get_current_session(),
+            self.tmux.get_sessions()
+        )
+
+        if not available:
             await self.update_status("❌ Error: tmux is not installed or not available")
             await self.action_quit()
             return
-            
-        # Get current session if inside tmux
-        self.current_session = self.tmux.get_current_session()
+        self.sessions = sessions if sessions is not None else []
         if self.current_session:
             await self.update_status(f"📍 Inside session: {self.current_session}")
-        
-        # Load initial sessions
-        self.refresh_sessions()
+
+        await self.update_filtered_sessions()
+        await self.update_status(f"✅ Found {len(self.sessions)} sessions")
         
     @work(exclusive=True)
     async def refresh_sessions(self) -> None:
         """Refresh the session list."""
+        self._refresh_token += 1
+        token = self._refresh_token
         await self.update_status("🔄 Refreshing sessions...")
-        self.sessions = self.tmux.get_sessions()
+        sessions = await self.tmux.get_sessions()
+        if token != self._refresh_token:
+            # A newer refresh started while tmux was answering - drop this
+            # result rather than rendering an obsolete list
+            return
+        if sessions is None:
+            # Nothing changed since the last refresh - skip the re-render
+            await self.update_status(f"✅ Found {len(self.sessions)} sessions")
+            return
+        self.sessions = sessions
         await self.update_filtered_sessions()
         await self.update_status(f"✅ Found {len(self.sessions)} sessions")
         
     async def update_filtered_sessions(self) -> None:
         """Update filtered sessions based on search and filters."""
-        filtered = self.sessions.copy()
-        
-        # Apply favorites filter
-        if self.show_favorites_only:
-            filtered = [s for s in filtered if s.is_favorite]
-            
-        # Apply search filter
-        if self.search_query:
-            query = self.search_query.lower()
-            filtered = [s for s in filtered if query in s.name.lower()]
-            
+        # Apply both filters in a single pass - one comprehension, one
+        # allocation, instead of a copy plus a list per active filter
+        query = self._search_query_lower
+        fav_only = self.show_favorites_only
+        sessions = self.sessions
+        filtered = [
+            s for s in sessions
+            if (not fav_only or s.is_favorite)
+            and (query is None or query in s._name_lower)
+        ]
+
+        if filtered == self.filtered_sessions:
+            return
+
         self.filtered_sessions = filtered
         await self.update_session_list()
         
+    def build_session_text(self, session: TmuxSession) -> Text:
+        """Get the (memoized) rich display text for a single session row."""
+        return _render_session_text(
+            session.is_favorite,
+            session.attached,
+            session.name,
+            session.windows,
+            session.created,
+            session.window_preview,
+            session.name == self.current_session,
+        )
+
+    def _append_session_row(self, session: TmuxSession) -> None:
+        """Materialize one session as a ListView row."""
+        display_text = self.build_session_text(session)
+        list_item = ListItem(Label(display_text))
+        list_item.data = session  # Stored for O(1) selection lookup
+        self.session_list.append(list_item)
+        self._rendered_markup[session.name] = display_text.markup
+
     async def update_session_list(self) -> None:
-        """Update the session list with current data."""
-        if not self.session_list:
+        """Update the session list, touching only the rows that changed."""
+        # ListView defines __len__, so an empty (but mounted) list is falsy -
+        # guard on None explicitly or the initial rows never get mounted
+        if self.session_list is None:
             return
-            
-        # Clear existing items
-        self.session_list.clear()
-        
-        # Add session items with rich formatting
-        for session in self.filtered_sessions:
-            # Create rich display text
-            status_color = "green" if session.attached else "cyan"
-            name_style = "bold green" if session.attached else "white"
-            
-            display_text = Text()
-            display_text.append(f"{session.favorite_icon} ", style="yellow")
-            display_text.append(f"{session.status_icon} ", style=status_color)
-            display_text.append(f"{session.name}", style=name_style)
-            display_text.append(f" ({session.windows}w)", style="cyan")
-            display_text.append(f" - {session.created}", style="dim")
-            
-            if session.window_preview:
-                display_text.append(f" [{session.window_preview}]", style="dim")
-            
-            if session.name == self.current_session:
-                display_text.append(" [CURRENT]", style="bold magenta")
-                
-            list_item = ListItem(display_text)
-            list_item.data = session.name  # Store session name for reference
-            self.session_list.append(list_item)
+
+        # Virtualization: only materialize the current render window - the
+        # rest of the filtered list stays as plain data until scrolled to
+        window = self.filtered_sessions[:self._render_limit]
+        new_keys = [s.name for s in window]
+
+        rendered_count = len(self._rendered_keys)
+        if new_keys[:rendered_count] == self._rendered_keys:
+            # The rendered rows are a prefix of the new window: unchanged
+            # keys, render-window growth while scrolling, or a refresh whose
+            # key list happens to extend the old one. Refresh the overlap in
+            # place - a refresh replaces the session objects (and may change
+            # their labels) even when the keys match, and selection must hand
+            # out the live object - then append any tail without clearing,
+            # which would reset the highlight.
+            for list_item, session in zip(self.session_list.children, window):
+                list_item.data = session
+                display_text = self.build_session_text(session)
+                if display_text.markup != self._rendered_markup.get(session.name):
+                    list_item.query_one(Label).update(display_text)
+                    self._rendered_markup[session.name] = display_text.markup
+            for session in window[rendered_count:]:
+                self._append_session_row(session)
+            self._rendered_keys = new_keys
+            return
+
+        # Row set changed - reconcile index-by-index: refresh overlapping
+        # rows in place, drop surplus items and append missing ones, instead
+        # of clearing the ListView and remounting every row
+        children = list(self.session_list.children)
+        common = min(len(children), len(window))
+        self._rendered_markup = {}
+
+        for list_item, session in zip(children, window):
+            display_text = self.build_session_text(session)
+            list_item.query_one(Label).update(display_text)
+            list_item.data = session
+            self._rendered_markup[session.name] = display_text.markup
+
+        for list_item in children[common:]:
+            await list_item.remove()
+
+        for session in window[common:]:
+            self._append_session_row(session)
+
+        self._rendered_keys = new_keys
+
+    async def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Grow the render window when the highlight nears its end."""
+        if event.list_view is not self.session_list:
+            return
+        index = self.session_list.index
+        rendered_count = len(self._rendered_keys)
+        if (index is not None
+                and len(self.filtered_sessions) > rendered_count
+                and index >= rendered_count - 10):
+            self._render_limit = rendered_count + self.RENDER_WINDOW
+            await self.update_session_list()
             
     def get_selected_session(self) -> Optional[TmuxSession]:
-        """Get the currently selected session."""
-        if not self.session_list or not self.filtered_sessions:
+        """Get the currently selected session in O(1) via the row's data."""
+        if self.session_list is None or not self.filtered_sessions:
             return None
-            
+
         try:
             highlighted = self.session_list.highlighted_child
-            if highlighted and hasattr(highlighted, 'data'):
-                session_name = highlighted.data
-                return next((s for s in self.filtered_sessions if s.name == session_name), None)
+            if highlighted is not None:
+                session = getattr(highlighted, "data", None)
+                if isinstance(session, TmuxSession):
+                    return session
         except:
             pass
         return None
@@ -583,30 +992,35 @@ class TpikApp(App):
             await self.action_quit()
             
     async def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes with a short debounce."""
         if event.input.id == "search":
-            self.search_query = event.value
-            await self.update_filtered_sessions()
+            # Coalesce keystroke bursts - only the last value in a ~70ms
+            # window triggers the filter + list update
+            self._pending_search = event.value
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(0.07, self._apply_search)
+
+    async def _apply_search(self) -> None:
+        """Apply the most recent search query after the debounce window."""
+        self._search_timer = None
+        if self._pending_search == self.search_query:
+            # Burst ended on the value already applied (e.g. a character
+            # typed and deleted) - nothing to filter
+            return
+        self.search_query = self._pending_search
+        self._search_query_lower = self.search_query.lower() if self.search_query else None
+        await self.update_filtered_sessions()
             
-    async def on_key(self, event: events.Key) -> None:
-        """Handle keyboard shortcuts."""
-        key = event.key
-        
-        if key == "enter":
+    async def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Attach when a session row is selected with enter."""
+        if event.list_view is self.session_list:
             await self.action_attach()
-        elif key == "n":
-            await self.action_new_session()
-        elif key == "delete":
-            await self.action_kill_session()
-        elif key == "f":
-            await self.action_toggle_favorites_filter()
-        elif key == "f5":
-            self.refresh_sessions()
-        elif key == "q":
-            await self.action_quit()
-        elif key == "space":
-            await self.action_toggle_favorite()
-            
+
+    def action_refresh(self) -> None:
+        """Refresh the session list."""
+        self.refresh_sessions()
+
     async def action_attach(self) -> None:
         """Attach to the selected session."""
         session = self.get_selected_session()
@@ -615,13 +1029,22 @@ class TpikApp(App):
             return
             
         await self.update_status(f"🎯 Attaching to {session.name}...")
-        success, message = self.tmux.attach_session(session.name)
+        success, message = await self.tmux.attach_session(session.name)
         
         if success:
             if self.tmux.is_inside_tmux():
                 await self.update_status(f"✅ {message}")
-                # Don't quit when switching inside tmux
-                self.refresh_sessions()
+                # Don't quit when switching inside tmux - patch the attached
+                # flags locally instead of re-listing; F5 still does a full sync
+                previous = self.current_session
+                self.current_session = session.name
+                self.tmux._current_session = session.name
+                for s in self.sessions:
+                    if s.name == session.name:
+                        s.attached = True
+                    elif s.name == previous:
+                        s.attached = False
+                await self.update_session_list()
             else:
                 # Store the session name for the wrapper script
                 session_file = Path.home() / ".tpik_session"
@@ -636,11 +1059,23 @@ class TpikApp(App):
         session_name = f"session-{len(self.sessions) + 1:03d}"
         
         await self.update_status(f"✨ Creating session {session_name}...")
-        success, message = self.tmux.create_session(session_name)
-        
+        success, message = await self.tmux.create_session(session_name)
+
         if success:
             await self.update_status(f"✅ {message}")
-            self.refresh_sessions()
+            # We know exactly what was created - patch the in-memory list
+            # (at its sorted position, matching list-sessions order) instead
+            # of re-forking tmux
+            now = time.localtime()
+            new_session = TmuxSession(
+                name=session_name,
+                created=f"{now.tm_mon:02d}/{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}",
+                windows=1
+            )
+            new_session.is_favorite = session_name in self.tmux.load_favorites()
+            index = bisect.bisect([s.name for s in self.sessions], session_name)
+            self.sessions.insert(index, new_session)
+            await self.update_filtered_sessions()
         else:
             await self.update_status(f"❌ {message}")
             
@@ -657,11 +1092,14 @@ class TpikApp(App):
             return
             
         await self.update_status(f"💀 Killing session {session.name}...")
-        success, message = self.tmux.kill_session(session.name)
-        
+        success, message = await self.tmux.kill_session(session.name)
+
         if success:
             await self.update_status(f"✅ {message}")
-            self.refresh_sessions()
+            # We know exactly which session vanished - drop it from the
+            # in-memory list instead of re-forking tmux
+            self.sessions = [s for s in self.sessions if s.name != session.name]
+            await self.update_filtered_sessions()
         else:
             await self.update_status(f"❌ {message}")
             
@@ -672,13 +1110,32 @@ class TpikApp(App):
             await self.update_status("⚠️ No session selected")
             return
             
-        is_fav = self.tmux.toggle_favorite(session.name)
+        # The toggle writes the favorites file - do the disk I/O in a worker
+        # thread so the event loop keeps rendering
+        is_fav = await asyncio.to_thread(self.tmux.toggle_favorite, session.name)
         session.is_favorite = is_fav
-        
+
         status = "Added to" if is_fav else "Removed from"
         icon = "⭐" if is_fav else "☆"
         await self.update_status(f"{icon} {status} favorites: {session.name}")
-        await self.update_session_list()
+        if self.show_favorites_only:
+            # Row membership changed - recompute the filter
+            await self.update_filtered_sessions()
+        else:
+            # Only one row's icon changed - update it in place
+            self._update_session_row(session)
+
+    def _update_session_row(self, session: TmuxSession) -> None:
+        """Refresh a single rendered row in place, without a list diff."""
+        if self.session_list is None:
+            return
+        try:
+            index = self._rendered_keys.index(session.name)
+        except ValueError:
+            return
+        display_text = self.build_session_text(session)
+        self.session_list.children[index].query_one(Label).update(display_text)
+        self._rendered_markup[session.name] = display_text.markup
         
     async def action_toggle_favorites_filter(self) -> None:
         """Toggle the favorites filter."""
@@ -10,13 +10,14 @@ from typing import List, Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
 from textual.widgets import Header, Footer, Static, Button, ListView, ListItem, Label
-from textual.reactive import reactive
 from textual import events
 
 
 class TmuxSession:
     """Simple tmux session representation."""
-    
+
+    __slots__ = ("name", "attached")
+
     def __init__(self, name: str, attached: bool = False):
         self.name = name
         self.attached = attached
@@ -62,11 +63,13 @@ class SimpleTpikApp(App):
             )
             
             self.sessions = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    name, attached = line.split("|")
-                    session = TmuxSession(name, attached == "1")
-                    self.sessions.append(session)
+            # splitlines avoids the strip+split re-scan, and partition yields
+            # the two fields without allocating a list
+            for line in result.stdout.splitlines():
+                if not line:
+                    continue
+                name, _, attached = line.partition("|")
+                self.sessions.append(TmuxSession(name, attached == "1"))
                     
         except subprocess.CalledProcessError:
             self.sessions = []